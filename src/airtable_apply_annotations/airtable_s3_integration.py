@@ -16,6 +16,11 @@ from typing import Dict, Any, List
 import requests
 from config import BUCKET, EXTENSIONS
 
+# shared session so paginated and batched requests reuse the TLS connection
+_SESSION = requests.Session()
+# (connect, read) timeouts in seconds
+TIMEOUT = (3.05, 30)
+
 
 class AirTableS3Integration:
     def __init__(self, airtable_url: str, filter_formula: str, headers: Dict[str, str]):
@@ -40,10 +45,11 @@ class AirTableS3Integration:
         records, offset = [], 0
         while True:
             try:
-                response = requests.get(
+                response = _SESSION.get(
                     f"{self.airtable_url}&{self.filter_formula}",
                     params={"offset": offset},
                     headers=self.headers,
+                    timeout=TIMEOUT,
                 )
             except Exception as exc:
                 print(exc)
@@ -73,8 +79,8 @@ class AirTableS3Integration:
             payload (str): Record payload.
         """
         try:
-            response = requests.patch(
-                self.airtable_url, headers=self.headers, data=payload
+            response = _SESSION.patch(
+                self.airtable_url, headers=self.headers, data=payload, timeout=TIMEOUT
             )
         except Exception as exc:
             print(exc)
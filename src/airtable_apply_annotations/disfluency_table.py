@@ -20,6 +20,9 @@ from mispronunciation import detect_mispronunciation
 from airtable_s3_integration import AirTableS3Integration
 from s3_utils import delete_file, move_file, write_file
 
+# translation table splitting hyphenated words and deleting all other punctuations
+PUNCTUATION_TABLE = str.maketrans({**dict.fromkeys(string.punctuation), "-": " "})
+
 
 class DisfluencyTable(AirTableS3Integration):
     def __init__(self, airtable_url: str, filter_formula: str, headers: Dict[str, str]):
@@ -42,16 +45,13 @@ class DisfluencyTable(AirTableS3Integration):
 
         def classify_mispronunciation(transcript, ground_truth, language):
             _preprocess_sequence = (
-                lambda sequence: sequence.replace("-", " ")
-                .translate(str.maketrans("", "", string.punctuation))
-                .lower()
-                .strip()
+                lambda sequence: sequence.translate(PUNCTUATION_TABLE).lower().strip()
             )
 
             transcript = _preprocess_sequence(transcript).split()
             ground_truth = _preprocess_sequence(ground_truth).split()
 
-            homophones = HOMOPHONES[language] if language in HOMOPHONES else None
+            homophones = HOMOPHONES.get(language)
             mispronunciation = detect_mispronunciation(
                 ground_truth, transcript, homophones
             )
@@ -63,7 +63,7 @@ class DisfluencyTable(AirTableS3Integration):
         job_name, language = fields["Job Name"], fields["Language"]
         ground_truth, transcript = fields["Ground Truth"], fields["Transcript"]
         audio_filename = fields["Audio"][0]["filename"]
-        delete = fields["Delete?"] if "Delete?" in fields else False
+        delete = fields.get("Delete?", False)
 
         # recalculate disfluency
         disfluency = classify_mispronunciation(
@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Set
+from typing import List, Tuple
 from homophones import HOMOPHONES, match_sequence
 
 
 def detect_mispronunciation(
-    ground_truth: List[str], transcript: List[str], homophones: List[Set[str]] = None
+    ground_truth: List[str],
+    transcript: List[str],
+    homophones: List[Tuple[str, ...]] = None,
 ) -> str:
     """Detects if the pair of ground truth and transcript is considered as a
     mispronunciation.
@@ -29,8 +31,8 @@ def detect_mispronunciation(
     Args:
         ground_truth (List[str]): List of ground truth words.
         transcript (List[str]): List of transcript words.
-        homophones (List[Set[str]], optional): List of homophone families. Defaults to
-        None.
+        homophones (List[Tuple[str, ...]], optional): List of homophone families.
+                                                      Defaults to None.
 
     Returns:
         str: Type of mispronunciation present. Otherwise, None.
@@ -41,26 +43,26 @@ def detect_mispronunciation(
     if len(ground_truth) == 1 or len(transcript) == 0:
         return "DELETE"  # single word or filler-only transcript
 
-    tsc_idx = set(range(len(transcript)))
-    gt_idx = set(range(len(ground_truth)))
+    if len(transcript) < len(ground_truth):
+        # both sequences have as many aligned words, so the ground truth residue is
+        # always larger and the verdict is either deletion or no match
+        return "DELETE"
 
     aligned_tsc, aligned_gt, _ = match_sequence(transcript, ground_truth, homophones)
 
     if len(aligned_tsc) == 0 and len(aligned_gt) == 0:
         return "DELETE"  # zero matches/alignments, pretty much random
 
-    tsc_diff = tsc_idx.difference(aligned_tsc)
-    gt_diff = gt_idx.difference(aligned_gt)
+    # the transcript is at least as long, so its residue is never smaller
+    tsc_residue = len(transcript) - len(aligned_tsc)
+    gt_residue = len(ground_truth) - len(aligned_gt)
 
-    if len(gt_diff) == 0 and len(tsc_diff) == 0:
+    if tsc_residue == 0:
         return "DELETE"  # 100% match
-    elif len(gt_diff) > 0 and len(tsc_diff) == 0:
-        return "DELETE"  # deletion only
-    elif len(gt_diff) == 0 and len(tsc_diff) > 0:
+    elif gt_residue == 0:
         return "ADDITION"
-    elif len(tsc_diff) == len(gt_diff) and tsc_diff == gt_diff:
+    elif tsc_residue == gt_residue and aligned_tsc == aligned_gt:
+        # equally long sequences whose residues are at the exact same positions
         return "SUBSTITUTION"
-    elif len(tsc_diff) >= len(gt_diff):
-        return "ADDITION_SUBSTITUTION"
     else:
-        return "DELETE"
+        return "ADDITION_SUBSTITUTION"
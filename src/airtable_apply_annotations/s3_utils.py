@@ -16,7 +16,6 @@ from typing import Callable, List
 import boto3
 from botocore.exceptions import ClientError
 
-s3_resource = boto3.resource("s3")
 s3_client = boto3.client("s3")
 
 
@@ -46,8 +45,10 @@ def copy_file(bucket: str, file: str, source: str, destination: str):
         destination (str): Destination folder in S3 bucket.
     """
     try:
-        s3_resource.Object(bucket, f"{destination}/{file}").copy_from(
-            CopySource=f"{bucket}/{source}/{file}"
+        s3_client.copy_object(
+            Bucket=bucket,
+            Key=f"{destination}/{file}",
+            CopySource=f"{bucket}/{source}/{file}",
         )
         print(
             f"Copied file from {bucket}/{source}/{file} to",
@@ -67,10 +68,12 @@ def move_file(bucket: str, file: str, source: str, destination: str):
         destination (str): Destination folder in S3 bucket.
     """
     try:
-        s3_resource.Object(bucket, f"{destination}/{file}").copy_from(
-            CopySource=f"{bucket}/{source}/{file}"
+        s3_client.copy_object(
+            Bucket=bucket,
+            Key=f"{destination}/{file}",
+            CopySource=f"{bucket}/{source}/{file}",
         )
-        s3_resource.Object(bucket, f"{source}/{file}").delete()
+        s3_client.delete_object(Bucket=bucket, Key=f"{source}/{file}")
     except ClientError as exc:
         print(
             f"Failed to move file {bucket}/{source}/{file} to",
@@ -88,7 +91,7 @@ def delete_file(bucket: str, file: str, source: str):
         source (str): Source folder in S3 bucket.
     """
     try:
-        s3_resource.Object(bucket, f"{source}/{file}").delete()
+        s3_client.delete_object(Bucket=bucket, Key=f"{source}/{file}")
         # print(f"Deleted file from {bucket}/{source}/{file}")
     except ClientError as exc:
         print(f"Failed to delete {bucket}/{source}/{file}")
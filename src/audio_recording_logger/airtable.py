@@ -14,8 +14,29 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List
-import json
+import orjson
+
+# shared session so batched requests reuse the TLS connection
+_SESSION = requests.Session()
+# retry rate limits with exponential backoff; rate limited requests and failed
+# connections never reached AirTable, whereas resending after a server error or a
+# read timeout could create the records twice
+_RETRIES = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=_RETRIES)
+)
+# (connect, read) timeouts in seconds
+TIMEOUT = (3.05, 30)
 
 
 class AirTable:
@@ -41,8 +62,11 @@ class AirTable:
             bool: Whether upload was a success.
         """
         try:
-            response = requests.post(
-                self.url, headers=self.headers, data=json.dumps({"records": records})
+            response = _SESSION.post(
+                self.url,
+                headers=self.headers,
+                data=orjson.dumps({"records": records}),
+                timeout=TIMEOUT,
             )
         except Exception as exc:
             print(exc)
@@ -14,7 +14,29 @@
 
 import os
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+
+# shared session so warm invocations reuse the TLS connection
+_SESSION = requests.Session()
+# retry rate limits with exponential backoff; rate limited requests and failed
+# connections never reached AirTable, whereas resending after a server error or a
+# read timeout could create the records twice
+_RETRIES = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=_RETRIES)
+)
+# (connect, read) timeouts in seconds
+TIMEOUT = (3.05, 30)
+AIRTABLE_URL = "https://api.airtable.com/v0/appMU2kEdFeVZJ0SS/Master"
 
 
 class AirTableLogger:
@@ -61,16 +83,17 @@ class AirTableLogger:
             "Category": self.category,
         }
 
-        airtable_url = "https://api.airtable.com/v0/appMU2kEdFeVZJ0SS/Master"
         api_key = os.environ["AIRTABLE_API_KEY"]
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
-        payload = json.dumps({"records": [{"fields": fields}]})
+        payload = orjson.dumps({"records": [{"fields": fields}]})
 
         try:
-            response = requests.post(airtable_url, headers=headers, data=payload)
+            response = _SESSION.post(
+                AIRTABLE_URL, headers=headers, data=payload, timeout=TIMEOUT
+            )
         except Exception as exc:
             print(exc)
         else:
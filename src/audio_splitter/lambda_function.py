@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List, Dict, Any
 from urllib.parse import unquote_plus
 import os
@@ -27,6 +28,9 @@ from src.audio_splitter.s3_utils import (
     # create_presigned_url,
 )
 
+# module-level so that its threads survive across warm invocations
+executor = ThreadPoolExecutor(max_workers=3)
+
 
 def trim_audio(input_path: str, start: float, end: float) -> Tuple[bytes, bytes]:
     """Trims audio from `input_path` from `start` to `end` (in seconds), pipes output
@@ -154,6 +158,19 @@ def split_export_audio(
         print("Admin annotation not found")
 
 
+def is_warmer_event(event: Dict[str, Any]) -> bool:
+    """Checks if `event` is a scheduled warm-up ping rather than an S3 event.
+
+    Args:
+        event (Dict[str, Any]): Event received by the Lambda function.
+
+    Returns:
+        bool: Whether `event` is a warm-up ping, i.e. `{"ping": true}` or an event
+              from the `warmer` source.
+    """
+    return bool(event.get("ping")) or event.get("source") == "warmer"
+
+
 def lambda_handler(event, context):
     """Event listener for S3 event and calls the split audio function.
 
@@ -167,6 +184,10 @@ def lambda_handler(event, context):
     Raises:
         e: Audio cannot be obtained from S3.
     """
+    # scheduled warm-up invocations keep the container warm without doing any work
+    if is_warmer_event(event):
+        return {"ping": "pong"}
+
     bucket = event["Records"][0]["s3"]["bucket"]["name"]
     key = unquote_plus(event["Records"][0]["s3"]["object"]["key"], encoding="utf-8")
 
@@ -199,11 +220,16 @@ def lambda_handler(event, context):
             )
 
             audio_extension = audio_extension[1:]  # removes the dot
-            # moves original audio and text to `archive`
-            for ext in [audio_extension, "srt", "txt"]:
-                move_file(
+            # moves original audio and text to `archive`, concurrently
+            moves = [
+                executor.submit(
+                    move_file,
                     bucket,
                     f"{job_name}.{ext}",
                     f"dropbox/{folder_name}",
                     f"archive/{folder_name}",
                 )
+                for ext in [audio_extension, "srt", "txt"]
+            ]
+            for move in moves:
+                move.result()
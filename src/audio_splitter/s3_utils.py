@@ -85,13 +85,14 @@ def move_file(bucket: str, file: str, source: str, destination: str) -> None:
         source (str): Source folder in S3 bucket.
         destination (str): Destination folder in S3 bucket.
     """
-    s3_resource = boto3.resource("s3")
-
     try:
-        s3_resource.Object(bucket, f"{destination}/{file}").copy_from(
-            CopySource=f"{bucket}/{source}/{file}"
+        # uses the (thread-safe) client, so that files can be moved concurrently
+        s3_client.copy_object(
+            Bucket=bucket,
+            Key=f"{destination}/{file}",
+            CopySource=f"{bucket}/{source}/{file}",
         )
-        s3_resource.Object(bucket, f"{source}/{file}").delete()
+        s3_client.delete_object(Bucket=bucket, Key=f"{source}/{file}")
         print(
             f"Moved file from {bucket}/{source}/{file} to {bucket}/{destination}/{file}"
         )
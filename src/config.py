@@ -10,18 +10,20 @@ REGION = "ap-southeast-1"
 SIGNED_URL_TIMEOUT = 3600
 
 # Language codes accepted for AWS Transcribe
-LANGUAGE_CODES = [
-    "en-AB",
-    "en-AU",
-    "en-GB",
-    "en-IE",
-    "en-IN",
-    "en-US",
-    "en-WL",
-    "en-ZA",
-    "en-NZ",
-    "id-ID",
-]
+LANGUAGE_CODES = frozenset(
+    {
+        "en-AB",
+        "en-AU",
+        "en-GB",
+        "en-IE",
+        "en-IN",
+        "en-US",
+        "en-WL",
+        "en-ZA",
+        "en-NZ",
+        "id-ID",
+    }
+)
 
 # File extensions
 EXTENSIONS = ["txt", "srt", "json", "aac", "wav", "m4a"]
@@ -14,8 +14,8 @@
 
 from math import ceil
 from typing import Any, Dict, List
-from operator import itemgetter
-from itertools import groupby
+from operator import itemgetter, sub
+from itertools import count, groupby
 from src.transcribe.homophones import HOMOPHONES, match_sequence
 
 
@@ -51,6 +51,20 @@ def init_label_studio_annotation() -> List[Dict[str, Any]]:
     ]
 
 
+def extract_transcripts(results: Dict[str, List]) -> List[str]:
+    """Extracts the lowercased, stripped content of every AWS Transcribe item.
+
+    Args:
+        results (Dict[str, List]): Resultant output received from AWS Transcribe.
+
+    Returns:
+        List[str]: List of transcribed tokens, including punctuations.
+    """
+    return [
+        item["alternatives"][0]["content"].lower().strip() for item in results["items"]
+    ]
+
+
 def overlapping_segments(
     results: Dict[str, List], ground_truth: str, language: str, max_repeats: int = None
 ) -> List[Dict[str, Any]]:
@@ -71,9 +85,8 @@ def overlapping_segments(
     output = []
     sentence_counter = 0
 
-    transcripts = [
-        item["alternatives"][0]["content"].lower().strip() for item in results["items"]
-    ]
+    items = results["items"]
+    transcripts = extract_transcripts(results)
 
     ground_truth = ground_truth.lower().strip().replace("-", " ").split(" ")
 
@@ -84,24 +97,28 @@ def overlapping_segments(
     multiplier = (
         max_repeats if max_repeats else ceil(len(transcripts) / len(ground_truth))
     )
-    ground_truth *= multiplier
 
     # find overlaps and mark as new sequence
-    homophones = HOMOPHONES[language] if language in HOMOPHONES else None
-    aligned_transcripts, *_ = match_sequence(transcripts, ground_truth, homophones)
-
-    for _, g in groupby(enumerate(aligned_transcripts), lambda x: x[0] - x[1]):
-        # add a newly initialized pair of lists if new sequence is detected
-        seq = list(map(itemgetter(1), g))
+    homophones = HOMOPHONES.get(language)
+    aligned_transcripts, *_ = match_sequence(
+        transcripts, ground_truth, homophones, repeats=multiplier
+    )
 
-        # first and last element of the sequence
-        first, last = seq[0], seq[-1]
+    # consecutive indices share the same (index - position) key; computing keys with
+    # `map(sub, ...)` and grouping on `itemgetter(0)` avoids a Python lambda per item
+    keys = map(sub, aligned_transcripts, count())
+    for _, g in groupby(zip(keys, aligned_transcripts), itemgetter(0)):
+        # first and last element of the sequence, without materializing it
+        first = last = next(g)[1]
+        for _, last in g:
+            pass
 
         # in case it overlaps only on punctuations, then skip
-        if "start_time" not in results["items"][first]:
+        first_item = items[first]
+        if "start_time" not in first_item:
             continue
 
-        output = output + init_label_studio_annotation()
+        output.extend(init_label_studio_annotation())
 
         idx = sentence_counter * 3
 
@@ -110,25 +127,23 @@ def overlapping_segments(
         ground_truth_dict = output[idx + 2]
 
         sentence_id = f"sentence_{sentence_counter}"
-        text_dict["id"] = sentence_id
-        label_dict["id"] = sentence_id
-        ground_truth_dict["id"] = sentence_id
+        text_dict["id"] = label_dict["id"] = ground_truth_dict["id"] = sentence_id
 
         text_values = text_dict["value"]
         label_values = label_dict["value"]
-        ground_truth_values = ground_truth_dict["value"]
+        gt_values = ground_truth_dict["value"]
 
         # start time is at the first word of the sequence
         # end time is at the last word of the sequence
-        for d in [text_values, label_values, ground_truth_values]:
-            d["start"] = float(results["items"][first]["start_time"])
-            d["end"] = float(results["items"][last]["end_time"])
+        start = float(first_item["start_time"])
+        end = float(items[last]["end_time"])
+        text_values["start"] = label_values["start"] = gt_values["start"] = start
+        text_values["end"] = label_values["end"] = gt_values["end"] = end
 
         # concat words in a sequence with whitespace
         overlap = [" ".join(transcripts[first : last + 1])]
         # provide region-wise transcription and ground truth for convenience
-        for d in [text_values, ground_truth_values]:
-            d["text"] = overlap
+        text_values["text"] = gt_values["text"] = overlap
 
         sentence_counter += 1
 
@@ -12,9 +12,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import requests
+from functools import lru_cache
 import json
 import os
+from src.transcribe.http_utils import SESSION, TIMEOUT
+
+
+@lru_cache(maxsize=4096)
+def _predict(url: str, api_key: str, audio_url: str) -> str:
+    """Requests a speaker type prediction of `audio_url` from the classifier API.
+
+    Failures raise instead of returning, so that only successful predictions are
+    memoized and transient errors are retried on the next call.
+
+    Args:
+        url (str): Classifier API endpoint.
+        api_key (str): Classifier API key.
+        audio_url (str): S3 URL pointing to the audio.
+
+    Raises:
+        ValueError: Classifier failed to predict the audio.
+
+    Returns:
+        str: "ADULT" or "CHILD".
+    """
+    with SESSION.post(
+        url,
+        headers={"Authorization": api_key},
+        json={"audio_url": audio_url},
+        timeout=TIMEOUT,
+        stream=True,
+    ) as response:
+        # short-circuit before reading the body on failed requests
+        response.raise_for_status()
+        prediction = json.loads(response.content)["body"]["prediction"]
+
+    if prediction is None:
+        raise ValueError(f"No prediction returned for audio {audio_url}")
+
+    return prediction
 
 
 class SpeakerClassifier:
@@ -34,31 +70,22 @@ class SpeakerClassifier:
         self.audio_url = audio_url
         api = "audio-classifier-adult-child"
         self.url = f"https://ety3wzgylf.execute-api.ap-southeast-1.amazonaws.com/{api}"
-        self.headers = {
-            "Authorization": os.environ["API_KEY"],
-            "Content-Type": "application/json",
-        }
-        self.payload = {"audio_url": self.audio_url}
+        # `requests` sets the JSON content type when sending with `json=`
+        self.headers = {"Authorization": os.environ["API_KEY"]}
 
     def predict(self) -> str:
         """Predicts the audio's speaker type, either child or adult.
+        Predictions are cached per audio URL, so repeated calls are free.
 
         Returns:
             str: "ADULT" or "CHILD", optionally "None" if errs.
         """
         try:
-            response = requests.post(
-                self.url, headers=self.headers, data=json.dumps(self.payload)
-            )
+            return _predict(self.url, self.headers["Authorization"], self.audio_url)
         except Exception as exc:
             print(f"Failed to predict for audio {self.audio_url}")
             print(exc)
             return "None"
-        else:
-            if response.ok:
-                return response.json()["body"]["prediction"]
-            else:
-                return "None"
 
 
 # if __name__ == "__main__":
@@ -0,0 +1,35 @@
+# Copyright 2022 [PT BOOKBOT INDONESIA](https://bookbot.id/)
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# session shared by the classifier API and transcript downloads, so that warm
+# invocations reuse their TLS connections
+SESSION = requests.Session()
+# retry transient failures with exponential backoff; both the classifier's POST and
+# the transcript GET are safe to resend
+RETRIES = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=2, pool_maxsize=32, max_retries=RETRIES)
+)
+# (connect, read) timeouts in seconds
+TIMEOUT = (3.05, 30)
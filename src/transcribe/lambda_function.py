@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
 import os
 import string
-from typing import Dict, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import unquote_plus
 
 from src.config import BUCKET, SIGNED_URL_TIMEOUT, LANGUAGE_CODES
@@ -28,6 +31,15 @@ from src.transcribe.aligner import overlapping_segments
 
 s3_client = S3Client(region_name="ap-southeast-1")
 transcribe_client = TranscribeClient(region_name="ap-southeast-1")
+# module-level so that their threads survive across warm invocations; the ground
+# truth's txt/srt requests get a pool of their own, since `get_ground_truth` itself
+# runs on `executor` and blocks on them
+executor = ThreadPoolExecutor(max_workers=1)
+ground_truth_executor = ThreadPoolExecutor(max_workers=2)
+# statuses of Transcribe jobs which won't report a state change anymore
+FINISHED_JOB_STATUSES = frozenset({"COMPLETED", "FAILED"})
+# translation table splitting hyphenated words and deleting all other punctuations
+PUNCTUATION_TABLE = str.maketrans({**dict.fromkeys(string.punctuation), "-": " "})
 
 
 def get_language_code(filename: str) -> str:
@@ -39,7 +51,20 @@ def get_language_code(filename: str) -> str:
     Returns:
         str: Language code of the audio file, formatted for AWS Transcribe.
     """
-    folder = os.path.basename(os.path.dirname(filename))
+    return folder_language_code(os.path.basename(os.path.dirname(filename)))
+
+
+@lru_cache(maxsize=256)
+def folder_language_code(folder: str) -> str:
+    """Get language code from a language folder name, e.g. `en-au`.
+    Cached, as files mostly arrive in bursts from the same few folders.
+
+    Args:
+        folder (str): Name of the folder containing the audio file.
+
+    Returns:
+        str: Language code of the folder, formatted for AWS Transcribe.
+    """
     language, country = folder.split("-")
     language_code = f"{language}-{country.upper()}"
 
@@ -60,18 +85,25 @@ def get_ground_truth(ground_truth_filename_prefix: str) -> Tuple[str, str]:
         Tuple[str, str]: Pair of [ground truth string, ground truth file extension],
             otherwise `[None, None]`.
     """
-    txt_transcript_file = s3_client.get_object(
-        BUCKET, f"{ground_truth_filename_prefix}.txt"
-    )
-    srt_transcript_file = s3_client.get_object(
-        BUCKET, f"{ground_truth_filename_prefix}.srt"
+    # request both candidates concurrently, txt taking precedence over srt
+    txt_future, srt_future = (
+        ground_truth_executor.submit(
+            s3_client.get_object, BUCKET, f"{ground_truth_filename_prefix}.{ext}"
+        )
+        for ext in ("txt", "srt")
     )
 
     # if txt exists
+    txt_transcript_file = txt_future.result()
     if txt_transcript_file:
+        srt_future.cancel()
         return (txt_transcript_file["Body"].read().decode("utf-8"), "txt")
-    elif srt_transcript_file:
-        return (srt2txt(srt_transcript_file["Body"].read().decode("utf-8")), "srt")
+
+    srt_transcript_file = srt_future.result()
+    if srt_transcript_file:
+        # decode and parse the subtitles while streaming them
+        srt_lines = codecs.getreader("utf-8")(srt_transcript_file["Body"])
+        return (srt2txt(srt_lines), "srt")
     else:
         return (None, None)
 
@@ -92,27 +124,36 @@ def classify_mispronunciation(
     """
 
     def _preprocess_sequence(sequence):
-        return (
-            sequence.replace("-", " ")
-            .translate(str.maketrans("", "", string.punctuation))
-            .lower()
-            .strip()
-        )
+        return sequence.translate(PUNCTUATION_TABLE).lower().strip()
 
+    # same as `_preprocess_sequence`, inlined to save a call per token
     transcripts = [
-        _preprocess_sequence(item["alternatives"][0]["content"])
+        item["alternatives"][0]["content"].translate(PUNCTUATION_TABLE).lower().strip()
         for item in results["items"]
     ]
 
     ground_truth = _preprocess_sequence(ground_truth).split()
 
-    homophones = HOMOPHONES[language] if language in HOMOPHONES else None
+    homophones = HOMOPHONES.get(language)
 
     mispronunciation = detect_mispronunciation(ground_truth, transcripts, homophones)
 
     return mispronunciation
 
 
+def is_warmer_event(event: Dict[str, Any]) -> bool:
+    """Checks if `event` is a scheduled warm-up ping rather than an S3 event.
+
+    Args:
+        event (Dict[str, Any]): Event received by the Lambda function.
+
+    Returns:
+        bool: Whether `event` is a warm-up ping, i.e. `{"ping": true}` or an event
+              from the `warmer` source.
+    """
+    return bool(event.get("ping")) or event.get("source") == "warmer"
+
+
 def lambda_handler(event, context):
     """Event listener for S3 event and calls Transcribe job.
 
@@ -124,46 +165,147 @@ def lambda_handler(event, context):
             An object that provides methods and properties that provide information
             about the invocation, function, and runtime environment.
     """
+    # scheduled warm-up invocations keep the container warm without doing any work
+    if is_warmer_event(event):
+        return {"ping": "pong"}
+
     bucket = event["Records"][0]["s3"]["bucket"]["name"]
     key = unquote_plus(event["Records"][0]["s3"]["object"]["key"], encoding="utf-8")
     main(f"s3://{bucket}/{key}")
 
 
-def main(audio_file: str):
-    """Main function to run Transcribe, generate Label Studio JSON-annotation,
-    and saves JSON to S3.
+def start_transcribe_handler(event, context):
+    """Event listener for S3 event which only starts the Transcribe job.
+    The job's results are processed by `finish_transcribe_handler` once AWS Transcribe
+    reports its completion, so no Lambda time is billed while waiting.
+
+    Args:
+        event (AWS Event):
+            A JSON-formatted document that contains data for a Lambda function
+            to process.
+        context (AWS Context):
+            An object that provides methods and properties that provide information
+            about the invocation, function, and runtime environment.
+    """
+    if is_warmer_event(event):
+        return {"ping": "pong"}
+
+    bucket = event["Records"][0]["s3"]["bucket"]["name"]
+    key = unquote_plus(event["Records"][0]["s3"]["object"]["key"], encoding="utf-8")
+    audio_file = f"s3://{bucket}/{key}"
+
+    # jobs which had already finished, e.g. of re-uploaded audios, never trigger
+    # `finish_transcribe_handler` again, so their results are processed right away
+    if start_transcription(audio_file) in FINISHED_JOB_STATUSES:
+        finish_transcription(audio_file)
+
+
+def finish_transcribe_handler(event, context):
+    """Event listener for EventBridge `Transcribe Job State Change` event, which
+    generates and saves the Label Studio JSON-annotation of the finished job.
+
+    Args:
+        event (AWS Event):
+            A JSON-formatted document that contains data for a Lambda function
+            to process.
+        context (AWS Context):
+            An object that provides methods and properties that provide information
+            about the invocation, function, and runtime environment.
+    """
+    if is_warmer_event(event):
+        return {"ping": "pong"}
+
+    job_name = event["detail"]["TranscriptionJobName"]
+    job = transcribe_client.get_job(transcribe_client.client, job_name)
+    if job is None:
+        print(f"Transcription job {job_name} not found.")
+        return
+
+    finish_transcription(job["TranscriptionJob"]["Media"]["MediaFileUri"])
+
+
+def parse_audio_file(audio_file: str) -> Tuple[str, str, str]:
+    """Parses the job name, extension and folder name of an audio file.
 
     Args:
         audio_file (str): Audio filename with complete S3 path.
+
+    Returns:
+        Tuple[str, str, str]: Tuple of job name, audio extension (without the dot) and
+            folder name, e.g. `("job", "aac", "en-au")`.
     """
-    EXT2FORMAT = {"wav": "wav", "m4a": "mp4", "aac": "mp4"}
     job_name, audio_extension = os.path.splitext(os.path.basename(audio_file))
-    audio_extension = audio_extension[1:]
     folder_name = os.path.basename(os.path.dirname(audio_file))
-    language = folder_name.split("-")[0]
-    language_code = get_language_code(audio_file)
-    ground_truth, ground_truth_ext = get_ground_truth(
-        f"dropbox/{folder_name}/{job_name}"
-    )
+    return job_name, audio_extension[1:], folder_name
+
+
+def start_transcription(
+    audio_file: str, ground_truth_future: Optional[Future] = None
+) -> Optional[str]:
+    """Archives adult audios, otherwise starts the audio's Transcribe job.
+
+    Args:
+        audio_file (str): Audio filename with complete S3 path.
+        ground_truth_future (Optional[Future], optional):
+            Pending `get_ground_truth` of the audio, only needed to archive adult
+            audios. Fetched from S3 if `None`. Defaults to `None`.
+
+    Returns:
+        Optional[str]: Status of the audio's Transcribe job, e.g. `"IN_PROGRESS"` if
+            it was just started, `None` if the audio was archived.
+    """
+    EXT2FORMAT = {"wav": "wav", "m4a": "mp4", "aac": "mp4"}
+    job_name, audio_extension, folder_name = parse_audio_file(audio_file)
 
     speaker_type = SpeakerClassifier(audio_file).predict()
     if speaker_type == "ADULT":
         print("Adult audio detected. Archiving audio.")
-        for ext in [audio_extension, ground_truth_ext]:
-            s3_client.move_file(
-                BUCKET,
-                f"{job_name}.{ext}",
-                f"dropbox/{folder_name}",
-                f"archive/adult/{folder_name}",
-            )
-        return
+        if ground_truth_future is None:
+            _, ground_truth_ext = get_ground_truth(f"dropbox/{folder_name}/{job_name}")
+        else:
+            _, ground_truth_ext = ground_truth_future.result()
+        s3_client.move_files(
+            BUCKET,
+            [f"{job_name}.{ext}" for ext in [audio_extension, ground_truth_ext]],
+            f"dropbox/{folder_name}",
+            f"archive/adult/{folder_name}",
+        )
+        return None
+
+    job = transcribe_client.get_job(transcribe_client.client, job_name)
+    if job:
+        print(f"Transcription job {job_name} already exists.")
+        return job["TranscriptionJob"]["TranscriptionJobStatus"]
 
-    status, results, task = transcribe_client.transcribe_file(
+    transcribe_client.start_job(
         job_name,
         audio_file,
         media_format=EXT2FORMAT[audio_extension],
-        language_code=language_code,
+        language_code=get_language_code(audio_file),
     )
+    return "IN_PROGRESS"
+
+
+def finish_transcription(
+    audio_file: str, ground_truth_pair: Optional[Tuple[str, str]] = None
+):
+    """Waits for the audio's Transcribe job, generates its Label Studio
+    JSON-annotation, and saves JSON to S3.
+
+    Args:
+        audio_file (str): Audio filename with complete S3 path.
+        ground_truth_pair (Optional[Tuple[str, str]], optional):
+            Ground truth pair as returned by `get_ground_truth`. Fetched from S3 if
+            `None`. Defaults to `None`.
+    """
+    job_name, audio_extension, folder_name = parse_audio_file(audio_file)
+    language = folder_name.split("-")[0]
+
+    if ground_truth_pair is None:
+        ground_truth_pair = get_ground_truth(f"dropbox/{folder_name}/{job_name}")
+    ground_truth, ground_truth_ext = ground_truth_pair
+
+    status, results, task = transcribe_client.wait_for_task(job_name, audio_file)
 
     transcribed_text = task["predictions"][0]["result"][0]["value"]["text"][0]
     mispronunciation = None
@@ -186,19 +328,19 @@ def main(audio_file: str):
         # archive Transcribe-failed annotations
         save_path = f"archive/{folder_name}/{job_name}.json"
         # move audios to `archive`
-        for ext in [audio_extension, ground_truth_ext]:
-            s3_client.move_file(
-                BUCKET,
-                f"{job_name}.{ext}",
-                f"dropbox/{folder_name}",
-                f"archive/{folder_name}",
-            )
+        s3_client.move_files(
+            BUCKET,
+            [f"{job_name}.{ext}" for ext in [audio_extension, ground_truth_ext]],
+            f"dropbox/{folder_name}",
+            f"archive/{folder_name}",
+        )
     else:
         # otherwise, save annotations to `label-studio/verified` for audio splitting
         save_path = f"label-studio/verified/{folder_name}/{job_name}.json"
 
     if mispronunciation:
-        # copy audio to a separate folder for annotation
+        # copy audio to a separate folder for annotation; this must finish before the
+        # JSON is exported, which triggers the audio splitter to archive the audio
         s3_client.copy_file(
             BUCKET,
             f"{job_name}.{audio_extension}",
@@ -218,3 +360,21 @@ def main(audio_file: str):
     # export JSON to respective folders in S3
     s3_client.put_object(task, BUCKET, save_path)
     print(f"File {save_path} successfully created and saved.")
+
+
+def main(audio_file: str):
+    """Main function to run Transcribe, generate Label Studio JSON-annotation,
+    and saves JSON to S3.
+
+    Args:
+        audio_file (str): Audio filename with complete S3 path.
+    """
+    job_name, _, folder_name = parse_audio_file(audio_file)
+    # fetch the ground truth in the background, while classifying the speaker and
+    # starting the Transcribe job
+    ground_truth_future = executor.submit(
+        get_ground_truth, f"dropbox/{folder_name}/{job_name}"
+    )
+
+    if start_transcription(audio_file, ground_truth_future) is not None:
+        finish_transcription(audio_file, ground_truth_future.result())
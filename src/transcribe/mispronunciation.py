@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Set, Tuple
-from enum import Enum, auto
+from functools import lru_cache
+from typing import List, Tuple
+from enum import Enum
 from src.transcribe.homophones import HOMOPHONES, match_sequence
 
+# languages of the built-in homophone families, keyed by their identity
+_HOMOPHONE_LANGUAGES = {
+    id(families): language for language, families in HOMOPHONES.items()
+}
 
-class MispronunciationType(Enum):
-    ADDITION = auto()
-    SUBSTITUTION = auto()
-    ADDITION_SUBSTITUTION = auto()
+
+class MispronunciationType(str, Enum):
+    # members are their own names, so they compare and serialize as plain strings
+    ADDITION = "ADDITION"
+    SUBSTITUTION = "SUBSTITUTION"
+    ADDITION_SUBSTITUTION = "ADDITION_SUBSTITUTION"
 
 
 class Mispronunciation:
@@ -64,6 +71,10 @@ class Mispronunciation:
         self.opcodes = opcodes
 
 
+# filler words which are ignored in transcripts
+FILLERS = frozenset({"", "uh", "huh", "mm", "yeah", "mhm", "hmm", "hm"})
+
+
 def remove_fillers(word: str) -> bool:
     """Manually checks if a word is a filler word
 
@@ -73,12 +84,38 @@ def remove_fillers(word: str) -> bool:
     Returns:
         bool: `True` if word is not a filler. `False` otherwise.
     """
-    fillers = ("", "uh", "huh", "mm", "yeah", "mhm", "hmm", "hm")
-    return word not in fillers
+    return word not in FILLERS
+
+
+@lru_cache(maxsize=4096)
+def _match_sequence_cached(
+    transcript: Tuple[str, ...], ground_truth: Tuple[str, ...], language: str
+) -> Tuple[List[int], List[int], List[Tuple[str, int, int, int, int]]]:
+    """Cached `match_sequence` of a transcript and ground truth pair, aligned with the
+    built-in homophones of `language`. Reading passages are often read many times, so
+    identical pairs recur.
+
+    Args:
+        transcript (Tuple[str, ...]): Transcript words.
+        ground_truth (Tuple[str, ...]): Ground truth words.
+        language (str): Language of the built-in homophones, i.e. key in `HOMOPHONES`.
+
+    Returns:
+        Tuple[List[int], List[int], List[Tuple[str, int, int, int, int]]]:
+            Output of `match_sequence`, which must not be mutated.
+    """
+    return match_sequence(list(transcript), list(ground_truth), HOMOPHONES[language])
+
+
+def clear_cache():
+    """Clears the cache of aligned transcript and ground truth pairs."""
+    _match_sequence_cached.cache_clear()
 
 
 def detect_mispronunciation(
-    ground_truth: List[str], transcript: List[str], homophones: List[Set[str]] = None
+    ground_truth: List[str],
+    transcript: List[str],
+    homophones: List[Tuple[str, ...]] = None,
 ) -> Mispronunciation:
     """Detects if the pair of ground truth and transcript is considered as a
     mispronunciation.
@@ -90,8 +127,8 @@ def detect_mispronunciation(
     Args:
         ground_truth (List[str]): List of ground truth words.
         transcript (List[str]): List of transcript words.
-        homophones (List[Set[str]], optional): List of homophone families. Defaults
-                                               to None.
+        homophones (List[Tuple[str, ...]], optional): List of homophone families.
+                                                      Defaults to None.
 
     Returns:
         Mispronunciation: Object of mispronunciation present. Otherwise, `None`.
@@ -148,47 +185,54 @@ def detect_mispronunciation(
     if homophones is None:
         homophones = HOMOPHONES["en"]
 
-    transcript = list(filter(remove_fillers, transcript))
+    transcript = [word for word in transcript if remove_fillers(word)]
 
     if len(ground_truth) == 1 or len(transcript) == 0:
         return None  # single word or filler-only transcript
 
-    tsc_idx = set(range(len(transcript)))
-    gt_idx = set(range(len(ground_truth)))
+    if len(transcript) < len(ground_truth):
+        # both sequences have as many aligned words, so the ground truth residue is
+        # always larger and the verdict is either deletion or no match
+        return None
 
-    aligned_tsc, aligned_gt, opcodes = match_sequence(
-        transcript, ground_truth, homophones
-    )
+    language = _HOMOPHONE_LANGUAGES.get(id(homophones))
+    if language is not None:
+        aligned_tsc, aligned_gt, opcodes = _match_sequence_cached(
+            tuple(transcript), tuple(ground_truth), language
+        )
+        # cached opcodes are shared, so each mispronunciation gets its own copy
+        opcodes = list(opcodes)
+    else:
+        aligned_tsc, aligned_gt, opcodes = match_sequence(
+            transcript, ground_truth, homophones
+        )
 
     if len(aligned_tsc) == 0 and len(aligned_gt) == 0:
         return None  # zero matches/alignments, pretty much random
 
-    tsc_diff = tsc_idx.difference(aligned_tsc)
-    gt_diff = gt_idx.difference(aligned_gt)
-
-    tsc_diff_words = [transcript[idx] for idx in tsc_diff]
-    gt_diff_words = [ground_truth[idx] for idx in gt_diff]
+    # both sequences have as many aligned words and the transcript is at least as
+    # long, so its residue is never smaller than the ground truth residue
+    tsc_residue = len(transcript) - len(aligned_tsc)
+    gt_residue = len(ground_truth) - len(aligned_gt)
 
-    mispronunciation = Mispronunciation(
-        None, (ground_truth, transcript), (gt_diff_words, tsc_diff_words), opcodes
-    )
-
-    if len(gt_diff) == 0 and len(tsc_diff) == 0:
+    # classify before building the differences, so that matches allocate nothing
+    if tsc_residue == 0:
         return None  # 100% match
-    elif len(gt_diff) > 0 and len(tsc_diff) == 0:
-        return None  # deletion only
-    elif len(gt_diff) == 0 and len(tsc_diff) > 0:
-        mispronunciation.type = MispronunciationType.ADDITION
-        return mispronunciation  # addition only
-    elif len(tsc_diff) == len(gt_diff) and tsc_diff == gt_diff:
-        mispronunciation.type = MispronunciationType.SUBSTITUTION
-        return mispronunciation  # strict substitution only
-    elif len(tsc_diff) >= len(gt_diff):
-        mispronunciation.type = MispronunciationType.ADDITION_SUBSTITUTION
-        return mispronunciation  # addition & substitution
+    elif gt_residue == 0:
+        verdict = MispronunciationType.ADDITION  # addition only
+    elif tsc_residue == gt_residue and aligned_tsc == aligned_gt:
+        # equally long sequences whose residues are at the exact same positions
+        verdict = MispronunciationType.SUBSTITUTION  # strict substitution only
     else:
-        # in cases where there is less spoken words (transcript) compared to GT,
-        # we assume that there is mostly deletion, although it may contain substitutions
-        # we think, the transcript thus contain little to no information that may be
-        # useful for training.
-        return None
+        verdict = MispronunciationType.ADDITION_SUBSTITUTION  # addition & substitution
+
+    # unaligned words are exactly those spanned by the non-"equal" opcodes
+    tsc_diff_words, gt_diff_words = [], []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag != "equal":
+            tsc_diff_words.extend(transcript[i1:i2])
+            gt_diff_words.extend(ground_truth[j1:j2])
+
+    return Mispronunciation(
+        verdict, (ground_truth, transcript), (gt_diff_words, tsc_diff_words), opcodes
+    )
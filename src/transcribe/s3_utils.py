@@ -12,16 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, List
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
-import json
+import orjson
+
+# objects larger than the threshold (in bytes) are uploaded in parallel parts
+MULTIPART_THRESHOLD = 5 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD, max_concurrency=4
+)
 
 
 class S3Client:
     def __init__(self, region_name="us-east-1"):
         self.client = boto3.client("s3", region_name=region_name)
-        self.resource = boto3.resource("s3", region_name=region_name)
 
     def move_file(self, bucket: str, file: str, source: str, destination: str):
         """Move `file` in `bucket` from `source` to `destination` folder
@@ -34,10 +42,12 @@ class S3Client:
         """
 
         try:
-            self.resource.Object(bucket, f"{destination}/{file}").copy_from(
-                CopySource=f"{bucket}/{source}/{file}"
+            self.client.copy_object(
+                Bucket=bucket,
+                Key=f"{destination}/{file}",
+                CopySource=f"{bucket}/{source}/{file}",
             )
-            self.resource.Object(bucket, f"{source}/{file}").delete()
+            self.client.delete_object(Bucket=bucket, Key=f"{source}/{file}")
         except Exception as exc:
             print(
                 f"Failed to move file from {bucket}/{source}/{file} to",
@@ -50,6 +60,70 @@ class S3Client:
                 f"{bucket}/{destination}/{file}",
             )
 
+    def move_files(self, bucket: str, files: List[str], source: str, destination: str):
+        """Move `files` in `bucket` from `source` to `destination` folder.
+        Files are copied concurrently, after which all successfully copied files are
+        deleted from `source` in a single batch request.
+
+        Args:
+            bucket (str): S3 bucket name.
+            files (List[str]): Names of files to be moved (without full-path).
+            source (str): Source folder in S3 bucket.
+            destination (str): Destination folder in S3 bucket.
+        """
+
+        def _copy(file: str) -> bool:
+            try:
+                # boto3 clients are safe to share across threads
+                self.client.copy_object(
+                    Bucket=bucket,
+                    Key=f"{destination}/{file}",
+                    CopySource=f"{bucket}/{source}/{file}",
+                )
+            except Exception as exc:
+                print(
+                    f"Failed to move file from {bucket}/{source}/{file} to",
+                    f"{bucket}/{destination}/{file}",
+                )
+                print(exc)
+                return False
+            return True
+
+        if not files:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            copied = [f for f, ok in zip(files, executor.map(_copy, files)) if ok]
+
+        if not copied:
+            return
+
+        try:
+            response = self.client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": f"{source}/{file}"} for file in copied]},
+            )
+        except Exception as exc:
+            print(f"Failed to delete moved files from {bucket}/{source}")
+            print(exc)
+            return
+
+        # failures of individual keys are reported in the response, not raised
+        failed = {error["Key"]: error for error in response.get("Errors", [])}
+        for file in copied:
+            error = failed.get(f"{source}/{file}")
+            if error is None:
+                print(
+                    f"Moved file from {bucket}/{source}/{file} to",
+                    f"{bucket}/{destination}/{file}",
+                )
+            else:
+                print(
+                    f"Copied file from {bucket}/{source}/{file} to",
+                    f"{bucket}/{destination}/{file}, but failed to delete it:",
+                    f"{error.get('Code')} {error.get('Message')}",
+                )
+
     def copy_file(self, bucket: str, file: str, source: str, destination: str):
         """Copy `file` in `bucket` from `source` to `destination` folder
 
@@ -61,8 +135,10 @@ class S3Client:
         """
 
         try:
-            self.resource.Object(bucket, f"{destination}/{file}").copy_from(
-                CopySource=f"{bucket}/{source}/{file}"
+            self.client.copy_object(
+                Bucket=bucket,
+                Key=f"{destination}/{file}",
+                CopySource=f"{bucket}/{source}/{file}",
             )
         except Exception:
             print(
@@ -94,6 +170,7 @@ class S3Client:
 
     def put_object(self, json_object: str, bucket: str, key: str):
         """Puts `json_object` (in str) to S3 bucket.
+        Large objects are uploaded as a concurrent multipart upload.
 
         Args:
             json_object (str): String representation of JSON object to put in S3.
@@ -101,14 +178,21 @@ class S3Client:
             key (str): Key to file in bucket.
         """
         try:
-            self.client.put_object(Body=json.dumps(json_object), Bucket=bucket, Key=key)
+            # `orjson` serializes straight to bytes, which S3 accepts as is
+            body = orjson.dumps(json_object)
+            if len(body) > MULTIPART_THRESHOLD:
+                self.client.upload_fileobj(
+                    BytesIO(body), bucket, key, Config=TRANSFER_CONFIG
+                )
+            else:
+                self.client.put_object(Body=body, Bucket=bucket, Key=key)
         except Exception as exc:
             print(exc)
 
     def create_presigned_url(
         self, bucket_name: str, object_name: str, expiration: int = 3600
     ) -> Any:
-        """Generate a presigned URL to share an S3 object
+        """Generate a presigned URL to share an S3 object.
 
         Args:
             bucket_name (str): Bucket name
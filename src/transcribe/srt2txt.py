@@ -12,24 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Iterable, Union
 import pysrt
 
 
-def srt2txt(srt_string: str) -> str:
+def srt2txt(srt_string: Union[str, Iterable[str]]) -> str:
     """Converts stream of srt subtitles to text format.
 
     Args:
-        srt_string (str): String-representation of srt subtitles.
+        srt_string (Union[str, Iterable[str]]): String-representation of srt subtitles,
+                                                or an iterable of its lines, e.g. a
+                                                decoded file stream.
 
     Returns:
         str: Cleaned text format of subtitles concatenated with space.
     """
-    subs = pysrt.from_string(srt_string)
-    texts = [sub.text for sub in subs]
-    # filter for empty strings
-    texts = list(filter(lambda text: len(text) > 0, texts))
-    # filter special tokens like [Music] and [Applause]
-    texts = list(filter(lambda text: text[0] != "[" and text[-1] != "]", texts))
-    texts = " ".join(texts)
+    lines = srt_string.splitlines(True) if isinstance(srt_string, str) else srt_string
+    # subtitles are parsed one at a time, without loading all of them at once
+    texts = (sub.text for sub in pysrt.stream(lines))
+    # filter for empty strings and special tokens like [Music] and [Applause]
+    texts = " ".join(
+        text for text in texts if len(text) > 0 and text[0] != "[" and text[-1] != "]"
+    )
     texts = texts.replace("\n", " ")
     return texts
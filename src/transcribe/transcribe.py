@@ -15,9 +15,39 @@
 from enum import Enum, auto
 from typing import Any, Dict, Tuple
 import boto3
-import time
-import requests
-from botocore.exceptions import ClientError
+import orjson
+from botocore.exceptions import ClientError, WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+from src.transcribe.http_utils import SESSION, TIMEOUT
+
+# AWS Transcribe has no built-in waiters, so a custom one polls every 2 seconds
+# until the job completes or fails, for up to Lambda's maximum 15 minute timeout
+JOB_DONE_WAITER = WaiterModel(
+    {
+        "version": 2,
+        "waiters": {
+            "JobDone": {
+                "delay": 2,
+                "maxAttempts": 450,
+                "operation": "GetTranscriptionJob",
+                "acceptors": [
+                    {
+                        "matcher": "path",
+                        "argument": "TranscriptionJob.TranscriptionJobStatus",
+                        "expected": "COMPLETED",
+                        "state": "success",
+                    },
+                    {
+                        "matcher": "path",
+                        "argument": "TranscriptionJob.TranscriptionJobStatus",
+                        "expected": "FAILED",
+                        "state": "failure",
+                    },
+                ],
+            }
+        },
+    }
+)
 
 
 class TranscribeStatus(Enum):
@@ -28,6 +58,7 @@ class TranscribeStatus(Enum):
 class TranscribeClient:
     def __init__(self, region_name="us-east-1"):
         self.client = boto3.client("transcribe", region_name=region_name)
+        self.waiter = create_waiter_with_client("JobDone", JOB_DONE_WAITER, self.client)
 
     def get_job(
         self, client: boto3.session.Session.client, job_name: str
@@ -64,17 +95,18 @@ class TranscribeClient:
         """
         try:
             download_uri = job["TranscriptionJob"]["Transcript"]["TranscriptFileUri"]
-            results = requests.get(download_uri).json()["results"]
+            response = SESSION.get(download_uri, timeout=TIMEOUT)
+            response.raise_for_status()
+            results = orjson.loads(response.content)["results"]
             transcriptions = [r["transcript"] for r in results["transcripts"]]
             # confidence score for the entire phrase is
             # a mean of confidence for individual words
-            confidence = sum(
-                float(item["alternatives"][0]["confidence"])
-                for item in results["items"]
-                if item["type"] == "pronunciation"
-            ) / sum(1.0 for item in results["items"] if item["type"] == "pronunciation")
-        except ZeroDivisionError:
-            confidence = 0.0
+            total_confidence, num_words = 0.0, 0
+            for item in results["items"]:
+                if item["type"] == "pronunciation":
+                    total_confidence += float(item["alternatives"][0]["confidence"])
+                    num_words += 1
+            confidence = total_confidence / num_words if num_words else 0.0
         except Exception as exc:
             print(f"Error: {exc}")
             return (
@@ -149,7 +181,27 @@ class TranscribeClient:
             print(f"Transcription job {job_name} already exists.")
             return self.create_task(file_uri, job)
 
-        # begin transcription job
+        self.start_job(job_name, file_uri, media_format, language_code)
+
+        # might be risky, but this relies on Lambda's timeout
+        return self.wait_for_task(job_name, file_uri)
+
+    def start_job(
+        self,
+        job_name: str,
+        file_uri: str,
+        media_format: str = "mp4",
+        language_code: str = "en-US",
+    ):
+        """Starts an AWS Transcribe job of an audio file, without waiting for it.
+
+        Args:
+            job_name (str): AWS Transcribe job name.
+            file_uri (str): URI to audio file in S3 to be Transcribed.
+            media_format (str, optional): Format of audio file. Defaults to "mp4".
+            language_code (str, optional): AWS Transcribe language code of audio.
+                                        Defaults to "en-US".
+        """
         print(f"Start transcription job {job_name}")
         self.client.start_transcription_job(
             TranscriptionJobName=job_name,
@@ -158,17 +210,31 @@ class TranscribeClient:
             LanguageCode=language_code,
         )
 
-        # might be risky, but this relies on Lambda's timeout
-        while True:
-            job = self.client.get_transcription_job(TranscriptionJobName=job_name)
-            job_status = job["TranscriptionJob"]["TranscriptionJobStatus"]
-            if job_status in ["COMPLETED", "FAILED"]:
-                print(f"Job {job_name} is {job_status}.")
-                # if transcription job completes or fails, create Label Studio
-                # JSON-formatted task accordingly
-                return self.create_task(file_uri, job)
-            elif job_status == "IN_PROGRESS":
-                # otherwise, if the transcription is still in progress, keep it running
-                print(f"Waiting for {job_name}. Current status is {job_status}.")
-                # give a 10 second timeout
-                time.sleep(10)
+    def wait_for_task(
+        self, job_name: str, file_uri: str
+    ) -> Tuple[TranscribeStatus, Dict[str, Any], Dict[str, Any]]:
+        """Waits for an AWS Transcribe job to complete or fail, then creates its
+        JSON-formatted task for Label Studio.
+
+        Args:
+            job_name (str): AWS Transcribe job name.
+            file_uri (str): URI to audio file in S3 being Transcribed.
+
+        Returns:
+            Tuple[TranscribeStatus, Dict[str, Any], Dict[str, Any]]:
+                Tuple consisting of (1) status of AWS Transcribe job, (2) AWS Transcribe
+                results and (3) JSON-formatted task for Label Studio
+        """
+        print(f"Waiting for {job_name}.")
+        try:
+            self.waiter.wait(TranscriptionJobName=job_name)
+        except WaiterError as exc:
+            # failed jobs still get a (failed) Label Studio task
+            print(exc)
+
+        # if transcription job completes or fails, create Label Studio
+        # JSON-formatted task accordingly
+        job = self.client.get_transcription_job(TranscriptionJobName=job_name)
+        job_status = job["TranscriptionJob"]["TranscriptionJobStatus"]
+        print(f"Job {job_name} is {job_status}.")
+        return self.create_task(file_uri, job)
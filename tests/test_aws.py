@@ -80,12 +80,32 @@ def test_transcribe(transcribe_client, transcribe_test):
     assert my_client.transcribe_file("NewJob", file_name) == failed_task
 
 
-def test_s3_utils(s3_client, s3_test):
+def test_s3_utils(s3_client, s3_test, capsys, monkeypatch):
     my_client = S3Client()
     my_client.put_object('{"data": "hello"}', "my-test-bucket", "source/test_file")
     my_client.copy_file("my-test-bucket", "test_file", "source", "dest")
     my_client.move_file("my-test-bucket", "test_file", "source", "dest")
     assert my_client.get_object("my-test-bucket", "dest/test_file") is not None
+    my_client.put_object('{"data": "hello"}', "my-test-bucket", "source/test_file")
+    my_client.move_files(
+        "my-test-bucket", ["test_file", "missing_file"], "source", "archive"
+    )
+    assert my_client.get_object("my-test-bucket", "archive/test_file") is not None
+    assert my_client.get_object("my-test-bucket", "source/test_file") is None
+    capsys.readouterr()
+
+    # per-key deletion failures are reported, not raised
+    my_client.put_object('{"data": "hello"}', "my-test-bucket", "source/test_file")
+    monkeypatch.setattr(
+        my_client.client,
+        "delete_objects",
+        lambda **kwargs: {
+            "Errors": [{"Key": "source/test_file", "Code": "AccessDenied"}]
+        },
+    )
+    my_client.move_files("my-test-bucket", ["test_file"], "source", "archive")
+    assert "failed to delete" in capsys.readouterr().out
+    monkeypatch.undo()
     assert my_client.create_presigned_url("my-test-bucket", "test_file").startswith(
         "https://my-test-bucket.s3.amazonaws.com/test_file"
     )
@@ -99,6 +119,7 @@ def test_lambda_function(
         get_ground_truth,
         classify_mispronunciation,
         lambda_handler,
+        finish_transcribe_handler,
     )
 
     results = {
@@ -169,3 +190,53 @@ def test_lambda_function(
     assert get_ground_truth("transcript") == (None, None)
     assert vars(output) == vars(mispronunciation)
     assert lambda_handler(test_event, None) is None
+    assert lambda_handler({"ping": True}, None) == {"ping": "pong"}
+    missing_job = {"detail": {"TranscriptionJobName": "MissingJob"}}
+    assert finish_transcribe_handler(missing_job, None) is None
+
+
+def test_split_handlers(s3_client, transcribe_client, intialize_credentials):
+    from src.config import BUCKET
+    from src.transcribe.lambda_function import (
+        start_transcribe_handler,
+        finish_transcribe_handler,
+        transcribe_client as lambda_transcribe_client,
+    )
+
+    s3_client.create_bucket(Bucket=BUCKET)
+    s3_client.put_object(Bucket=BUCKET, Key="dropbox/id-id/SplitJob.wav", Body=b"")
+    test_event = {
+        "Records": [
+            {
+                "s3": {
+                    "bucket": {"name": BUCKET},
+                    "object": {"key": "dropbox/id-id/SplitJob.wav"},
+                },
+            }
+        ]
+    }
+    my_client = S3Client()
+
+    assert start_transcribe_handler({"ping": True}, None) == {"ping": "pong"}
+    assert finish_transcribe_handler({"source": "warmer"}, None) == {"ping": "pong"}
+
+    # starting only creates the Transcribe job
+    assert start_transcribe_handler(test_event, None) is None
+    job = lambda_transcribe_client.get_job(lambda_transcribe_client.client, "SplitJob")
+    assert job["TranscriptionJob"]["Media"]["MediaFileUri"] == (
+        f"s3://{BUCKET}/dropbox/id-id/SplitJob.wav"
+    )
+    assert my_client.get_object(BUCKET, "archive/id-id/SplitJob.json") is None
+
+    # the job's state change then exports its (failed) Label Studio task
+    finished_job = {"detail": {"TranscriptionJobName": "SplitJob"}}
+    assert finish_transcribe_handler(finished_job, None) is None
+    assert my_client.get_object(BUCKET, "archive/id-id/SplitJob.json") is not None
+    assert my_client.get_object(BUCKET, "archive/id-id/SplitJob.wav") is not None
+
+    # re-uploaded audios of finished jobs are processed right away
+    s3_client.delete_object(Bucket=BUCKET, Key="archive/id-id/SplitJob.json")
+    s3_client.put_object(Bucket=BUCKET, Key="dropbox/id-id/SplitJob.wav", Body=b"")
+    assert start_transcribe_handler(test_event, None) is None
+    assert my_client.get_object(BUCKET, "archive/id-id/SplitJob.json") is not None
+    assert my_client.get_object(BUCKET, "dropbox/id-id/SplitJob.wav") is None
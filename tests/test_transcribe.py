@@ -1,5 +1,9 @@
 from src.transcribe.homophones import HOMOPHONES, match_sequence
-from src.transcribe.aligner import overlapping_segments, init_label_studio_annotation
+from src.transcribe.aligner import (
+    overlapping_segments,
+    init_label_studio_annotation,
+    extract_transcripts,
+)
 from src.transcribe.srt2txt import srt2txt
 from src.transcribe.classifier import SpeakerClassifier
 from src.transcribe.mispronunciation import (
@@ -56,6 +60,17 @@ def test_aligner():
         ],
     }
 
+    assert extract_transcripts(test_text) == [
+        "assalamualaikum",
+        ".",
+        "wow",
+        "!",
+        "wow",
+        "!",
+        "saya",
+        "enggak",
+    ]
+
     # case 1: ground truth aligned with aws transcribe results
     assert overlapping_segments(
         test_text, "Assalamualaikum Wow Saya enggak", language="id"
@@ -228,6 +243,44 @@ def test_homophones():
         [("equal", 0, 1, 0, 1), ("delete", 1, 3, 1, 1), ("equal", 3, 5, 1, 3)],
     )
 
+    # long passages with repeated words keep misreads as 1-1 replacements
+    words = ("a the the cat on a mat " * 20).split()[:134]
+    misread = words[:1] + ["zombie"] + words[2:]
+    assert match_sequence(misread, words, HOMOPHONES["en"]) == (
+        [0] + list(range(2, 134)),
+        [0] + list(range(2, 134)),
+        [("equal", 0, 1, 0, 1), ("replace", 1, 2, 1, 2), ("equal", 2, 134, 2, 134)],
+    )
+
+    # including against a ground truth repeated by the aligner
+    assert match_sequence(misread[:60], words[:60], None, repeats=3)[2] == [
+        ("equal", 0, 1, 0, 1),
+        ("replace", 1, 2, 1, 2),
+        ("equal", 2, 60, 2, 60),
+        ("insert", 60, 60, 60, 180),
+    ]
+
+    # no homophone families, e.g. for languages without a list
+    assert match_sequence(
+        ["weather", "is", "nice"], ["whether", "is", "nice"], None
+    ) == (
+        [1, 2],
+        [1, 2],
+        [("replace", 0, 1, 0, 1), ("equal", 1, 3, 1, 3)],
+    )
+
+    # ground truth read twice
+    assert match_sequence(
+        ["hi", "bob", "hi", "bob"], ["hi", "bob"], None, repeats=2
+    ) == ([0, 1, 2, 3], [0, 1, 2, 3], [("equal", 0, 4, 0, 4)])
+
+    # completely different sequences share no words
+    assert match_sequence(["hi", "bob"], ["good", "bye", "alice"], None) == (
+        [],
+        [],
+        [("replace", 0, 2, 0, 3)],
+    )
+
 
 def test_mispronunciation():
     assert (
@@ -246,6 +299,7 @@ def test_mispronunciation():
             HOMOPHONES["en"],
         ).type
         == MispronunciationType.ADDITION
+        == "ADDITION"
     )
     assert (
         detect_mispronunciation(
@@ -299,6 +353,15 @@ def test_mispronunciation():
         is None
     )
 
+    # a single misread word in a long passage with repeated words
+    words = ("a the the cat on a mat " * 20).split()[:134]
+    assert (
+        detect_mispronunciation(
+            words, words[:1] + ["zombie"] + words[2:], HOMOPHONES["en"]
+        ).type
+        == MispronunciationType.SUBSTITUTION
+    )
+
 
 def test_srt2txt():
     assert (
@@ -315,6 +378,11 @@ a subtitle.
 
     assert srt2txt("[Music]") == ""
 
+    # iterables of lines, e.g. decoded S3 streams
+    assert (
+        srt2txt(["1\n", "00:05:00,400 --> 00:05:15,300\n", "Hello!\n"]) == "Hello!"
+    )
+
 
 def test_classifier(intialize_credentials):
     sc = SpeakerClassifier("s3://test-audio.wav")